@@ -13,14 +13,24 @@ Models are trained using historical question data and saved in CoreML format.
 """
 
 import json
+import math
 import os
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
 from sklearn.metrics import accuracy_score, mean_squared_error
 import coremltools as ct
 
+# Numba is optional; when available the synthetic-response kernel is compiled
+# and parallelized across students, otherwise the NumPy version is used
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Constants
 INPUT_DATA_PATH = "../Data/timo_questions.json"
 OUTPUT_MODEL_DIR = "../Resources/MLModels"
@@ -39,155 +49,188 @@ def load_question_data(json_path):
 
 def preprocess_question_data(questions):
     """Preprocess question data for model training"""
-    # Extract features from questions
-    question_features = []
-    for q in questions:
-        # Get subject as one-hot encoded
-        subject_mapping = {
-            "Logical Thinking": [1, 0, 0, 0, 0],
-            "Arithmetic": [0, 1, 0, 0, 0],
-            "Number Theory": [0, 0, 1, 0, 0],
-            "Geometry": [0, 0, 0, 1, 0],
-            "Combinatorics": [0, 0, 0, 0, 1]
-        }
-        subject_vec = subject_mapping.get(q['subject'], [0, 0, 0, 0, 0])
-        
-        # Map difficulty to numerical value
-        difficulty_mapping = {
-            "Easy": 1,
-            "Medium": 2,
-            "Hard": 3,
-            "Olympiad": 4
-        }
-        difficulty = difficulty_mapping.get(q['difficulty'], 2)
-        
-        # Extract Elo rating if available, or use default
-        elo_rating = 1200
-        if 'parameters' in q and 'eloRating' in q['parameters']:
-            elo_rating = q['parameters']['eloRating']
-            
-        # Extract IRT parameters if available, or use defaults
-        irt_discrimination = 1.0
-        irt_difficulty = 0.0
-        irt_guessing = 0.25
-        
-        if 'parameters' in q and 'irt' in q['parameters']:
-            irt_params = q['parameters']['irt']
-            irt_discrimination = irt_params.get('discrimination', 1.0)
-            irt_difficulty = irt_params.get('difficulty', 0.0)
-            irt_guessing = irt_params.get('guessing', 0.25)
-        
-        # Get question type as binary feature (0 = multiple choice, 1 = open-ended)
-        is_open_ended = 1 if q['type'] == 'open-ended' else 0
-        
-        # Get question length as proxy for complexity
-        question_length = len(q['content']['question'])
-        
-        question_features.append({
-            'id': q['id'],
-            'subject_logical': subject_vec[0],
-            'subject_arithmetic': subject_vec[1],
-            'subject_numbertheory': subject_vec[2],
-            'subject_geometry': subject_vec[3],
-            'subject_combinatorics': subject_vec[4],
-            'difficulty': difficulty,
-            'is_open_ended': is_open_ended,
-            'question_length': question_length,
-            'elo_rating': elo_rating,
-            'irt_discrimination': irt_discrimination,
-            'irt_difficulty': irt_difficulty,
-            'irt_guessing': irt_guessing
-        })
-    
-    return pd.DataFrame(question_features)
+    # Flatten the nested question records into columns in one pass
+    df = pd.json_normalize(questions)
+
+    def flat_column(name, default):
+        """Get a flattened column with a default for missing values"""
+        if name in df.columns:
+            return df[name].fillna(default)
+        return pd.Series(default, index=df.index)
+
+    # One-hot encode subjects by broadcasting against the known subject list
+    subjects = np.array([
+        "Logical Thinking",
+        "Arithmetic",
+        "Number Theory",
+        "Geometry",
+        "Combinatorics"
+    ])
+    subject_one_hot = (df['subject'].to_numpy()[:, None] == subjects[None, :]).astype(np.int8)
+
+    # Map difficulty to numerical value
+    difficulty_mapping = {
+        "Easy": 1,
+        "Medium": 2,
+        "Hard": 3,
+        "Olympiad": 4
+    }
+
+    # Assemble the feature frame from typed columns in a single constructor
+    # call rather than inserting columns one at a time
+    return pd.DataFrame({
+        'id': df['id'],
+        'subject_logical': subject_one_hot[:, 0],
+        'subject_arithmetic': subject_one_hot[:, 1],
+        'subject_numbertheory': subject_one_hot[:, 2],
+        'subject_geometry': subject_one_hot[:, 3],
+        'subject_combinatorics': subject_one_hot[:, 4],
+        # Integer subject index, derived once so consumers don't re-run argmax
+        'subject_idx': np.argmax(subject_one_hot, axis=1).astype(np.int8),
+        'difficulty': df['difficulty'].map(difficulty_mapping).fillna(2).astype(np.int8),
+        # Question type as binary feature (0 = multiple choice, 1 = open-ended)
+        'is_open_ended': (df['type'] == 'open-ended').astype(np.int8),
+        # Question length as proxy for complexity
+        'question_length': df['content.question'].str.len(),
+        # Elo rating and IRT parameters with defaults for missing values
+        'elo_rating': flat_column('parameters.eloRating', 1200),
+        'irt_discrimination': flat_column('parameters.irt.discrimination', 1.0),
+        'irt_difficulty': flat_column('parameters.irt.difficulty', 0.0),
+        'irt_guessing': flat_column('parameters.irt.guessing', 0.25)
+    }, copy=False)
+
+def _simulate_responses_numpy(abilities, subject_prefs, disc, irt_diff, guess,
+                              subject_idx_arr, difficulty_arr,
+                              u_correct, u_time, u_noise_fast, u_noise_slow):
+    """NumPy fallback for the synthetic-response kernel"""
+    # Use IRT formula to calculate probability of correct answer for every
+    # (student, question) pair at once: higher ability students answer
+    # correctly more often, higher difficulty questions less often
+    z = disc[None, :] * (abilities[:, None] - irt_diff[None, :])
+    prob_correct = guess[None, :] + (1 - guess[None, :]) / (1 + np.exp(-z))
+
+    # Adjust probabilities based on each student's subject preferences
+    pref_boost = 0.1 * subject_prefs[:, subject_idx_arr]
+    prob_correct = np.minimum(0.95, prob_correct + pref_boost)
+
+    # Determine which answers are correct
+    is_correct = u_correct < prob_correct
+
+    # Generate synthetic response times (faster for easy questions/high ability)
+    base_time = 30  # baseline of 30 seconds
+    difficulty_factor = difficulty_arr * 5  # 5-20 seconds based on difficulty
+    ability_factor = 10 * (1 / (1 + np.exp(abilities)))  # 0-10 seconds based on ability
+
+    response_time = base_time + difficulty_factor[None, :] - ability_factor[:, None] + u_time
+
+    # Add noise to make it realistic; incorrect answers often take longer
+    noise = np.where(is_correct, u_noise_fast, u_noise_slow)
+    response_time = response_time * noise
+
+    return is_correct.astype(np.int64), response_time
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _simulate_responses(abilities, subject_prefs, disc, irt_diff, guess,
+                            subject_idx_arr, difficulty_arr,
+                            u_correct, u_time, u_noise_fast, u_noise_slow):
+        """Numba kernel: parallel over students, fused inner loop over questions"""
+        n_students = abilities.shape[0]
+        n_questions = disc.shape[0]
+        is_correct = np.empty((n_students, n_questions), dtype=np.int64)
+        response_time = np.empty((n_students, n_questions), dtype=np.float64)
+        for s in prange(n_students):
+            ability_factor = 10.0 / (1.0 + math.exp(abilities[s]))
+            for q in range(n_questions):
+                z = disc[q] * (abilities[s] - irt_diff[q])
+                prob_correct = guess[q] + (1.0 - guess[q]) / (1.0 + math.exp(-z))
+                prob_correct = min(0.95, prob_correct + 0.1 * subject_prefs[s, subject_idx_arr[q]])
+                correct = u_correct[s, q] < prob_correct
+                is_correct[s, q] = 1 if correct else 0
+                base = 30.0 + difficulty_arr[q] * 5.0 - ability_factor + u_time[s, q]
+                noise = u_noise_fast[s, q] if correct else u_noise_slow[s, q]
+                response_time[s, q] = base * noise
+        return is_correct, response_time
+else:
+    _simulate_responses = _simulate_responses_numpy
 
 def generate_synthetic_student_data(question_df, n_students=50):
     """Generate synthetic student response data for model training"""
-    np.random.seed(RANDOM_SEED)
-    
-    student_data = []
-    for i in range(n_students):
-        # Randomly assign student ability (-3 to +3 on IRT scale)
-        student_ability = np.random.normal(0, 1)
-        
-        # Create preferences for subjects (0-1 scale)
-        subject_prefs = np.random.dirichlet(np.ones(5)) * 2  # Dirichlet gives sum=1, scale up
-        
-        # Create response patterns based on ability and question difficulty
-        responses = []
-        for _, question in question_df.iterrows():
-            # Higher ability students answer correctly more often
-            # Higher difficulty questions are answered correctly less often
-            irt_diff = question['irt_difficulty']
-            disc = question['irt_discrimination']
-            guess = question['irt_guessing']
-            
-            # Use IRT formula to calculate probability of correct answer
-            z = disc * (student_ability - irt_diff)
-            prob_correct = guess + (1 - guess) / (1 + np.exp(-z))
-            
-            # Adjust probability based on student's subject preference
-            subject_idx = np.argmax([
-                question['subject_logical'],
-                question['subject_arithmetic'],
-                question['subject_numbertheory'],
-                question['subject_geometry'],
-                question['subject_combinatorics']
-            ])
-            pref_boost = 0.1 * subject_prefs[subject_idx]
-            prob_correct = min(0.95, prob_correct + pref_boost)
-            
-            # Determine if answer is correct
-            is_correct = np.random.random() < prob_correct
-            
-            # Generate synthetic response time (faster for easy questions/high ability)
-            base_time = 30  # baseline of 30 seconds
-            difficulty_factor = question['difficulty'] * 5  # 5-20 seconds based on difficulty
-            ability_factor = 10 * (1 / (1 + np.exp(student_ability)))  # 0-10 seconds based on ability
-            random_factor = np.random.uniform(0, 10)  # random variation
-            
-            response_time = base_time + difficulty_factor - ability_factor + random_factor
-            
-            # Add noise to make it realistic
-            if is_correct:
-                response_time *= np.random.uniform(0.8, 1.2)
-            else:
-                response_time *= np.random.uniform(0.9, 1.5)  # Incorrect answers often take longer
-            
-            responses.append({
-                'student_id': i,
-                'question_id': question['id'],
-                'is_correct': int(is_correct),
-                'response_time': response_time,
-                'difficulty': question['difficulty'],
-                'subject_idx': subject_idx
-            })
-        
-        student_data.append({
-            'student_id': i,
-            'ability': student_ability,
-            'subject_pref': subject_prefs,
-            'responses': responses
-        })
-    
-    # Convert to DataFrame
-    response_rows = []
-    for student in student_data:
-        for response in student['responses']:
-            response_row = {
-                'student_id': student['student_id'],
-                'student_ability': student['ability'],
-                'question_id': response['question_id'],
-                'is_correct': response['is_correct'],
-                'response_time': response['response_time'],
-                'difficulty': response['difficulty'],
-                'subject_idx': response['subject_idx']
-            }
-            for j, pref in enumerate(student['subject_pref']):
-                response_row[f'subject_pref_{j}'] = pref
-            response_rows.append(response_row)
-    
-    return pd.DataFrame(response_rows)
+    rng = np.random.default_rng(RANDOM_SEED)
+
+    # Pull the question columns out as NumPy arrays once, outside the student loop
+    n_questions = len(question_df)
+    question_ids = question_df['id'].to_numpy()
+    disc = question_df['irt_discrimination'].to_numpy(dtype=np.float64)
+    irt_diff = question_df['irt_difficulty'].to_numpy(dtype=np.float64)
+    guess = question_df['irt_guessing'].to_numpy(dtype=np.float64)
+    difficulty_arr = question_df['difficulty'].to_numpy()
+    subject_idx_arr = question_df['subject_idx'].to_numpy(dtype=np.int64)
+
+    # Randomly assign student abilities (-3 to +3 on IRT scale)
+    abilities = rng.standard_normal(n_students)
+
+    # Create preferences for subjects (0-1 scale)
+    subject_prefs = rng.dirichlet(np.ones(5), n_students) * 2  # Dirichlet gives sum=1, scale up
+
+    # Pre-draw all random matrices so the kernel itself is deterministic
+    # and identical between the Numba and NumPy paths
+    u_correct = rng.random((n_students, n_questions))
+    u_time = rng.uniform(0, 10, (n_students, n_questions))  # random variation
+    u_noise_fast = rng.uniform(0.8, 1.2, (n_students, n_questions))
+    u_noise_slow = rng.uniform(0.9, 1.5, (n_students, n_questions))  # incorrect answers often take longer
+
+    is_correct, response_time = _simulate_responses(
+        abilities, subject_prefs, disc, irt_diff, guess,
+        subject_idx_arr, difficulty_arr.astype(np.float64),
+        u_correct, u_time, u_noise_fast, u_noise_slow
+    )
+
+    # Flatten the (students x questions) matrices into one preallocated
+    # structured array; the DataFrame then adopts the typed columns directly
+    response_dtype = np.dtype(
+        [('student_id', 'i4'), ('student_ability', 'f8'), ('question_id', 'O'),
+         ('is_correct', 'i8'), ('response_time', 'f8'), ('difficulty', 'i8'),
+         ('subject_idx', 'i8')] +
+        [(f'subject_pref_{j}', 'f8') for j in range(5)]
+    )
+    responses = np.empty(n_students * n_questions, dtype=response_dtype)
+    responses['student_id'] = np.repeat(np.arange(n_students), n_questions)
+    responses['student_ability'] = np.repeat(abilities, n_questions)
+    responses['question_id'] = np.tile(question_ids, n_students)
+    responses['is_correct'] = is_correct.ravel()
+    responses['response_time'] = response_time.ravel()
+    responses['difficulty'] = np.tile(difficulty_arr, n_students)
+    responses['subject_idx'] = np.tile(subject_idx_arr, n_students)
+    for j in range(5):
+        responses[f'subject_pref_{j}'] = np.repeat(subject_prefs[:, j], n_questions)
+
+    return pd.DataFrame(responses)
+
+def save_coreml_model(coreml_model, filename, description):
+    """Set model metadata, compress weights when possible, and save to disk"""
+    # Set metadata - use properties instead of direct attribute assignment
+    spec = coreml_model.get_spec()
+    spec.description.metadata.shortDescription = description
+
+    # Palettize weights to 8-bit (k-means) to shrink the bundled model files;
+    # not every converted model supports compression, so fall back to the
+    # full-precision save if the optimizer rejects this model
+    try:
+        from coremltools.optimize.coreml import (
+            OpPalettizerConfig, OptimizationConfig, palettize_weights
+        )
+        config = OptimizationConfig(global_config=OpPalettizerConfig(mode='kmeans', nbits=8))
+        coreml_model = palettize_weights(coreml_model, config)
+    except Exception as e:
+        print(f"Weight palettization not applied ({e}); saving full-precision model")
+
+    # Create output directory if it doesn't exist
+    os.makedirs(OUTPUT_MODEL_DIR, exist_ok=True)
+
+    model_path = os.path.join(OUTPUT_MODEL_DIR, filename)
+    coreml_model.save(model_path)
+    return model_path
 
 def train_question_recommender(question_df, response_df):
     """Train the question recommender model"""
@@ -195,8 +238,15 @@ def train_question_recommender(question_df, response_df):
     
     # Create features for recommendation (student preferences and historical responses)
     student_features = []
-    recommendations = []
-    
+    top_student_ids = []
+    top_question_ids = []
+    top_scores = []
+
+    # Pull the question columns out as NumPy arrays once, outside the student loop
+    question_ids = question_df['id'].to_numpy()
+    irt_diff_arr = question_df['irt_difficulty'].to_numpy(dtype=np.float64)
+    subject_idx_arr = question_df['subject_idx'].to_numpy(dtype=np.int64)
+
     # Group responses by student
     for student_id, group in response_df.groupby('student_id'):
         # Get student's subject preferences
@@ -241,53 +291,44 @@ def train_question_recommender(question_df, response_df):
             'response_count': len(group)
         })
         
-        # Find appropriate next questions (challenging but doable)
-        for _, question in question_df.iterrows():
-            # Skip already answered correctly
-            if question['id'] in correct_questions:
-                continue
-                
-            # Calculate match score based on difficulty, student ability and preferences
-            subject_idx = np.argmax([
-                question['subject_logical'],
-                question['subject_arithmetic'],
-                question['subject_numbertheory'],
-                question['subject_geometry'],
-                question['subject_combinatorics']
-            ])
-            
-            # Score higher if:
-            # 1. Difficulty matches ability (not too hard, not too easy)
-            # 2. Subject matches student preference
-            # 3. Subject is a weak area (low accuracy)
-            
-            difficulty_match = 1.0 - abs(question['irt_difficulty'] - ability_estimate) / 6.0  # Scale to 0-1
-            subject_preference = subject_prefs[subject_idx]
-            subject_weakness = 1.0 - subject_accuracy.get(subject_idx, 0.5)  # Invert accuracy to get weakness
-            
-            recommendation_score = (
-                0.4 * difficulty_match + 
-                0.3 * subject_preference + 
-                0.3 * subject_weakness
-            )
-            
-            recommendations.append({
-                'student_id': student_id,
-                'question_id': question['id'],
-                'recommendation_score': recommendation_score
-            })
-    
-    # Convert to DataFrames
+        # Find appropriate next questions (challenging but doable),
+        # scoring every question for this student in one pass.
+        # Score higher if:
+        # 1. Difficulty matches ability (not too hard, not too easy)
+        # 2. Subject matches student preference
+        # 3. Subject is a weak area (low accuracy)
+        difficulty_match = 1.0 - np.abs(irt_diff_arr - ability_estimate) / 6.0  # Scale to 0-1
+        subject_preference = np.asarray(subject_prefs)[subject_idx_arr]
+        # Invert accuracy to get weakness
+        subject_weakness = 1.0 - np.array([subject_accuracy.get(i, 0.5) for i in range(5)])[subject_idx_arr]
+
+        recommendation_scores = (
+            0.4 * difficulty_match +
+            0.3 * subject_preference +
+            0.3 * subject_weakness
+        )
+
+        # Skip questions already answered correctly
+        candidate_mask = ~question_df['id'].isin(correct_questions).to_numpy()
+        candidate_ids = question_ids[candidate_mask]
+        candidate_scores = recommendation_scores[candidate_mask]
+
+        # Keep the top 20 recommended questions for this student via partial
+        # selection (argpartition is O(Q) vs a full O(Q log Q) sort)
+        k = min(20, len(candidate_scores))
+        top_idx = np.argpartition(-candidate_scores, k - 1)[:k] if k > 0 else np.empty(0, dtype=np.intp)
+        top_student_ids.append(np.full(k, student_id))
+        top_question_ids.append(candidate_ids[top_idx])
+        top_scores.append(candidate_scores[top_idx])
+
+    # Convert to DataFrames; the per-student arrays are concatenated once
+    # instead of stacking many small DataFrames
     student_df = pd.DataFrame(student_features)
-    recommendation_df = pd.DataFrame(recommendations)
-    
-    # For each student, select the top 20 recommended questions
-    top_recommendations = []
-    for student_id, group in recommendation_df.groupby('student_id'):
-        top_for_student = group.sort_values('recommendation_score', ascending=False).head(20)
-        top_recommendations.append(top_for_student)
-    
-    recommendation_targets = pd.concat(top_recommendations)
+    recommendation_targets = pd.DataFrame({
+        'student_id': np.concatenate(top_student_ids),
+        'question_id': np.concatenate(top_question_ids),
+        'recommendation_score': np.concatenate(top_scores)
+    })
     
     # Merge features with targets for training
     training_data = student_df.merge(
@@ -306,6 +347,7 @@ def train_question_recommender(question_df, response_df):
         n_estimators=100,
         learning_rate=0.1,
         max_depth=3,
+        subsample=0.8,  # stochastic boosting: fits each tree on 80% of rows
         random_state=RANDOM_SEED
     )
     
@@ -324,16 +366,9 @@ def train_question_recommender(question_df, response_df):
         'recommendation_score'
     )
     
-    # Set metadata - use properties instead of direct attribute assignment
-    spec = coreml_model.get_spec()
-    spec.description.metadata.shortDescription = "Question Recommender for TIMO Math"
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(OUTPUT_MODEL_DIR, exist_ok=True)
-    
     # Save CoreML model
-    model_path = os.path.join(OUTPUT_MODEL_DIR, 'QuestionRecommender.mlmodel')
-    coreml_model.save(model_path)
+    model_path = save_coreml_model(coreml_model, 'QuestionRecommender.mlmodel',
+                                   "Question Recommender for TIMO Math")
     print(f"Question Recommender model saved to {model_path}")
     
     return model
@@ -360,6 +395,7 @@ def train_ability_estimator(response_df):
         n_estimators=100,
         learning_rate=0.1,
         max_depth=5,
+        subsample=0.8,  # stochastic boosting: fits each tree on 80% of rows
         random_state=RANDOM_SEED
     )
     
@@ -377,13 +413,9 @@ def train_ability_estimator(response_df):
         'ability'
     )
     
-    # Set metadata - use properties instead of direct attribute assignment
-    spec = coreml_model.get_spec()
-    spec.description.metadata.shortDescription = "Student Ability Estimator for TIMO Math"
-    
     # Save CoreML model
-    model_path = os.path.join(OUTPUT_MODEL_DIR, 'AbilityEstimator.mlmodel')
-    coreml_model.save(model_path)
+    model_path = save_coreml_model(coreml_model, 'AbilityEstimator.mlmodel',
+                                   "Student Ability Estimator for TIMO Math")
     print(f"Ability Estimator model saved to {model_path}")
     
     return model
@@ -392,33 +424,37 @@ def train_difficulty_predictor(question_df, response_df):
     """Train the difficulty predictor model"""
     print("Training Difficulty Predictor Model...")
     
-    # Create features for difficulty prediction
-    difficulty_features = []
-    
-    for _, response in response_df.iterrows():
-        # Get question features
-        question = question_df[question_df['id'] == response['question_id']].iloc[0]
-        
-        # Create feature row
-        difficulty_features.append({
-            'student_ability': response['student_ability'],
-            'subject_idx': response['subject_idx'],
-            'subject_pref': response[f'subject_pref_{int(response["subject_idx"])}'],
-            'irt_discrimination': question['irt_discrimination'],
-            'irt_difficulty': question['irt_difficulty'],
-            'irt_guessing': question['irt_guessing'],
-            'is_open_ended': question['is_open_ended'],
-            'question_length': question['question_length'],
-            # Target: whether the student found it difficult
-            # (proxy: incorrect answer or long response time)
-            'perceived_difficulty': float(
-                not response['is_correct'] or 
-                response['response_time'] > 30  # Consider "difficult" if takes > 30s
-            )
-        })
-    
-    # Convert to DataFrame
-    difficulty_df = pd.DataFrame(difficulty_features)
+    # Join question features onto the responses in one hash-based merge
+    merged = response_df.merge(
+        question_df[[
+            'id', 'irt_discrimination', 'irt_difficulty', 'irt_guessing',
+            'is_open_ended', 'question_length'
+        ]],
+        left_on='question_id',
+        right_on='id',
+        how='left'
+    )
+
+    # Pick each student's preference for the subject of the answered question
+    subject_idx = merged['subject_idx'].to_numpy(dtype=np.intp)
+    pref_matrix = merged[[f'subject_pref_{i}' for i in range(5)]].to_numpy()
+    subject_pref = pref_matrix[np.arange(len(merged)), subject_idx]
+
+    difficulty_df = pd.DataFrame({
+        'student_ability': merged['student_ability'],
+        'subject_idx': merged['subject_idx'],
+        'subject_pref': subject_pref,
+        'irt_discrimination': merged['irt_discrimination'],
+        'irt_difficulty': merged['irt_difficulty'],
+        'irt_guessing': merged['irt_guessing'],
+        'is_open_ended': merged['is_open_ended'],
+        'question_length': merged['question_length'],
+        # Target: whether the student found it difficult
+        # (proxy: incorrect answer or response time > 30s)
+        'perceived_difficulty': (
+            (merged['is_correct'] == 0) | (merged['response_time'] > 30)
+        ).astype(float)
+    })
     
     # Prepare features and target for the model
     X = difficulty_df.drop(['perceived_difficulty'], axis=1)
@@ -432,6 +468,7 @@ def train_difficulty_predictor(question_df, response_df):
         n_estimators=100,
         learning_rate=0.1,
         max_depth=4,
+        subsample=0.8,  # stochastic boosting: fits each tree on 80% of rows
         random_state=RANDOM_SEED
     )
     
@@ -449,13 +486,9 @@ def train_difficulty_predictor(question_df, response_df):
         'difficulty'
     )
     
-    # Set metadata - use properties instead of direct attribute assignment
-    spec = coreml_model.get_spec()
-    spec.description.metadata.shortDescription = "Question Difficulty Predictor for TIMO Math"
-    
     # Save CoreML model
-    model_path = os.path.join(OUTPUT_MODEL_DIR, 'DifficultyPredictor.mlmodel')
-    coreml_model.save(model_path)
+    model_path = save_coreml_model(coreml_model, 'DifficultyPredictor.mlmodel',
+                                   "Question Difficulty Predictor for TIMO Math")
     print(f"Difficulty Predictor model saved to {model_path}")
     
     return model
@@ -475,17 +508,20 @@ def main():
     response_df = generate_synthetic_student_data(question_df)
     print(f"Generated synthetic data for {response_df['student_id'].nunique()} students with {len(response_df)} responses")
     
-    # Train the models
+    # Train the three models concurrently; each GradientBoostingRegressor
+    # fit is single-threaded, and the trainings are independent of each other
     print("\n--- Training Models ---")
-    recommender_model = train_question_recommender(question_df, response_df)
+    recommender_model, ability_model, difficulty_model = Parallel(n_jobs=3)(
+        delayed(train_fn)(*args) for train_fn, args in [
+            (train_question_recommender, (question_df, response_df)),
+            (train_ability_estimator, (response_df,)),
+            (train_difficulty_predictor, (question_df, response_df))
+        ]
+    )
     print("Question Recommender model trained successfully!")
-    
-    ability_model = train_ability_estimator(response_df)
     print("Ability Estimator model trained successfully!")
-    
-    difficulty_model = train_difficulty_predictor(question_df, response_df)
     print("Difficulty Predictor model trained successfully!")
-    
+
     print("\nModel training complete! All models saved to MLModels directory.")
 
 if __name__ == "__main__":
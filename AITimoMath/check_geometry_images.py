@@ -1,37 +1,63 @@
 #!/usr/bin/env python3
-import json
 import os
 
+import ijson
+import orjson
+
 # Path to the JSON file - corrected path
 json_file_path = 'AITimoMath/AITimoMath/Data/timo_questions.json'
+tmp_file_path = json_file_path + '.tmp'
 
-# Read the JSON file
-with open(json_file_path, 'r') as file:
-    data = json.load(file)
-
-# Find Geometry questions
-geometry_questions = [q for q in data['questions'] if q['subject'] == 'Geometry']
-print(f'Total Geometry questions: {len(geometry_questions)}')
+def read_top_level_value(path, key):
+    """Stream a single small top-level value out of the JSON file"""
+    with open(path, 'rb') as f:
+        for value in ijson.items(f, key, use_float=True):
+            return value
+    return None
 
-# Find questions with missing or incorrect imageData
+geometry_count = 0
 missing_or_incorrect = []
-for q in geometry_questions:
-    q_id = q['id']
-    if 'content' not in q or 'imageData' not in q['content'] or q['content']['imageData'] != q_id:
-        missing_or_incorrect.append(q_id)
-        # Update the imageData field
-        if 'content' in q:
-            q['content']['imageData'] = q_id
-            print(f'Updated imageData for {q_id}')
 
+# Stream the questions one at a time and rewrite the file incrementally,
+# so only one question is held in memory at any point
+version = read_top_level_value(json_file_path, 'version')
+last_updated = read_top_level_value(json_file_path, 'lastUpdated')
+categories = read_top_level_value(json_file_path, 'categories')
+
+with open(json_file_path, 'rb') as f, open(tmp_file_path, 'wb') as out:
+    out.write(b'{"version": ' + orjson.dumps(version) +
+              b', "lastUpdated": ' + orjson.dumps(last_updated) +
+              b', "questions": [')
+    first = True
+    for q in ijson.items(f, 'questions.item', use_float=True):
+        # Find Geometry questions with missing or incorrect imageData
+        if q['subject'] == 'Geometry':
+            geometry_count += 1
+            q_id = q['id']
+            if 'content' not in q or 'imageData' not in q['content'] or q['content']['imageData'] != q_id:
+                missing_or_incorrect.append(q_id)
+                # Update the imageData field
+                if 'content' in q:
+                    q['content']['imageData'] = q_id
+                    print(f'Updated imageData for {q_id}')
+        if not first:
+            out.write(b', ')
+        out.write(orjson.dumps(q))
+        first = False
+    out.write(b'], "categories": ' + orjson.dumps(categories) + b'}')
+
+print(f'Total Geometry questions: {geometry_count}')
 print(f'Questions with missing or incorrect imageData: {len(missing_or_incorrect)}')
 if missing_or_incorrect:
     print('IDs with issues:')
     for q_id in missing_or_incorrect:
         print(f'  - {q_id}')
 
-# Write the updated JSON back to the file
-with open(json_file_path, 'w') as file:
-    json.dump(data, file, indent=2)
-
-print(f'Successfully updated imageData for all Geometry questions in {json_file_path}') 
\ No newline at end of file
+# Atomically swap the rewritten file into place, but only when something
+# actually changed; otherwise keep the original file (and its mtime) intact
+if missing_or_incorrect:
+    os.replace(tmp_file_path, json_file_path)
+    print(f'Successfully updated imageData for all Geometry questions in {json_file_path}')
+else:
+    os.remove(tmp_file_path)
+    print(f'All Geometry questions already have correct imageData; {json_file_path} left untouched')
@@ -1,30 +1,51 @@
 #!/usr/bin/env python3
-import json
 import os
 
+import ijson
+import orjson
+
 # Path to the JSON file
 json_file_path = 'AITimoMath/Data/timo_questions.json'
+tmp_file_path = json_file_path + '.tmp'
 
-# Read the JSON file
-with open(json_file_path, 'r') as file:
-    data = json.load(file)
+def read_top_level_value(path, key):
+    """Stream a single small top-level value out of the JSON file"""
+    with open(path, 'rb') as f:
+        for value in ijson.items(f, key, use_float=True):
+            return value
+    return None
 
 # Count how many questions were updated
 updated_count = 0
 
-# Update the imageData field for all Geometry questions
-for question in data['questions']:
-    if question['subject'] == 'Geometry':
-        question_id = question['id']
-        # Check if content exists
-        if 'content' in question:
-            # Add or update the imageData field
-            question['content']['imageData'] = question_id
-            updated_count += 1
-            print(f'Updated imageData for {question_id}')
-
-# Write the updated JSON back to the file
-with open(json_file_path, 'w') as file:
-    json.dump(data, file, indent=2)
-
-print(f'Successfully updated imageData for {updated_count} Geometry questions in {json_file_path}') 
\ No newline at end of file
+# Stream the questions one at a time and rewrite the file incrementally,
+# so only one question is held in memory at any point
+version = read_top_level_value(json_file_path, 'version')
+last_updated = read_top_level_value(json_file_path, 'lastUpdated')
+categories = read_top_level_value(json_file_path, 'categories')
+
+with open(json_file_path, 'rb') as f, open(tmp_file_path, 'wb') as out:
+    out.write(b'{"version": ' + orjson.dumps(version) +
+              b', "lastUpdated": ' + orjson.dumps(last_updated) +
+              b', "questions": [')
+    first = True
+    for question in ijson.items(f, 'questions.item', use_float=True):
+        # Update the imageData field for all Geometry questions
+        if question['subject'] == 'Geometry':
+            question_id = question['id']
+            # Check if content exists
+            if 'content' in question:
+                # Add or update the imageData field
+                question['content']['imageData'] = question_id
+                updated_count += 1
+                print(f'Updated imageData for {question_id}')
+        if not first:
+            out.write(b', ')
+        out.write(orjson.dumps(question))
+        first = False
+    out.write(b'], "categories": ' + orjson.dumps(categories) + b'}')
+
+# Atomically swap the rewritten file into place
+os.replace(tmp_file_path, json_file_path)
+
+print(f'Successfully updated imageData for {updated_count} Geometry questions in {json_file_path}')